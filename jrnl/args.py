@@ -5,13 +5,7 @@ import argparse
 import re
 import textwrap
 
-from jrnl.commands import postconfig_decrypt
-from jrnl.commands import postconfig_encrypt
-from jrnl.commands import postconfig_import
-from jrnl.commands import postconfig_index
-from jrnl.commands import postconfig_list
-from jrnl.commands import preconfig_diagnostic
-from jrnl.commands import preconfig_version
+from jrnl import commands
 from jrnl.output import deprecated_cmd
 from jrnl.plugins import EXPORT_FORMATS
 from jrnl.plugins import IMPORT_FORMATS
@@ -100,28 +94,28 @@ def parse_args(args: list[str] = []) -> argparse.Namespace:
     standalone.add_argument(
         "--version",
         action="store_const",
-        const=preconfig_version,
+        const="preconfig_version",
         dest="preconfig_cmd",
         help="Print version information",
     )
     standalone.add_argument(
         "-v",
         action="store_const",
-        const=preconfig_version,
+        const="preconfig_version",
         dest="preconfig_cmd",
         help=argparse.SUPPRESS,
     )
     standalone.add_argument(
         "--diagnostic",
         action="store_const",
-        const=preconfig_diagnostic,
+        const="preconfig_diagnostic",
         dest="preconfig_cmd",
         help=argparse.SUPPRESS,
     )
     standalone.add_argument(
         "--list",
         action="store_const",
-        const=postconfig_list,
+        const="postconfig_list",
         dest="postconfig_cmd",
         help="""
         List all configured journals.
@@ -134,7 +128,7 @@ def parse_args(args: list[str] = []) -> argparse.Namespace:
     standalone.add_argument(
         "--ls",
         action="store_const",
-        const=postconfig_list,
+        const="postconfig_list",
         dest="postconfig_cmd",
         help=argparse.SUPPRESS,
     )
@@ -142,7 +136,7 @@ def parse_args(args: list[str] = []) -> argparse.Namespace:
         "-ls",
         action="store_const",
         const=lambda **kwargs: deprecated_cmd(
-            "-ls", "--list or --ls", callback=postconfig_list, **kwargs
+            "-ls", "--list or --ls", callback=commands.postconfig_list, **kwargs
         ),
         dest="postconfig_cmd",
         help=argparse.SUPPRESS,
@@ -152,7 +146,7 @@ def parse_args(args: list[str] = []) -> argparse.Namespace:
         help="Encrypt selected journal with a password",
         action="store_const",
         metavar="TYPE",
-        const=postconfig_encrypt,
+        const="postconfig_encrypt",
         dest="postconfig_cmd",
     )
     standalone.add_argument(
@@ -160,14 +154,14 @@ def parse_args(args: list[str] = []) -> argparse.Namespace:
         help="Decrypt selected journal and store it in plain text",
         action="store_const",
         metavar="TYPE",
-        const=postconfig_decrypt,
+        const="postconfig_decrypt",
         dest="postconfig_cmd",
     )
     standalone.add_argument(
         "--import",
         action="store_const",
         metavar="TYPE",
-        const=postconfig_import,
+        const="postconfig_import",
         dest="postconfig_cmd",
         help=f"""
         Import entries from another journal.
@@ -190,7 +184,7 @@ def parse_args(args: list[str] = []) -> argparse.Namespace:
     standalone.add_argument(
         "--index",
         action="store_const",
-        const=postconfig_index,
+        const="postconfig_index",
         dest="postconfig_cmd",
         help="""
         Build or update UUID index for Day One entries.
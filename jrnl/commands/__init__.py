@@ -0,0 +1,60 @@
+# Copyright © 2012-2023 jrnl contributors
+# License: https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Modules in this package are standalone commands. All standalone commands are split
+into two categories depending on whether they require the config to be loaded to be
+able to run.
+
+1. "preconfig" commands don't require the config at all, and can be run before the
+   config has been loaded.
+2. "postconfig" commands require to config to have already been loaded, parsed, and
+   scoped before they can be run.
+
+Each command lives in its own module, which is only imported the first time the
+command is requested from this package. Also, please note that all (non-builtin)
+imports should be scoped to each function to avoid any possible overhead for these
+standalone commands.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from jrnl.commands.decrypt import postconfig_decrypt
+    from jrnl.commands.diagnostic import preconfig_diagnostic
+    from jrnl.commands.encrypt import postconfig_encrypt
+    from jrnl.commands.import_ import postconfig_import
+    from jrnl.commands.index import postconfig_index
+    from jrnl.commands.list import postconfig_list
+    from jrnl.commands.version import preconfig_version
+
+__all__ = [
+    "preconfig_diagnostic",
+    "preconfig_version",
+    "postconfig_list",
+    "postconfig_import",
+    "postconfig_encrypt",
+    "postconfig_decrypt",
+    "postconfig_index",
+]
+
+_COMMANDS = {
+    "preconfig_diagnostic": "jrnl.commands.diagnostic",
+    "preconfig_version": "jrnl.commands.version",
+    "postconfig_list": "jrnl.commands.list",
+    "postconfig_import": "jrnl.commands.import_",
+    "postconfig_encrypt": "jrnl.commands.encrypt",
+    "postconfig_decrypt": "jrnl.commands.decrypt",
+    "postconfig_index": "jrnl.commands.index",
+}
+
+
+def __getattr__(name: str):
+    if name not in _COMMANDS:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    command = getattr(importlib.import_module(_COMMANDS[name]), name)
+    globals()[name] = command
+    return command
@@ -0,0 +1,45 @@
+# Copyright © 2012-2023 jrnl contributors
+# License: https://www.gnu.org/licenses/gpl-3.0.html
+
+import argparse
+import logging
+
+
+def postconfig_decrypt(
+    args: argparse.Namespace, config: dict, original_config: dict
+) -> int:
+    """Decrypts to file. If filename is not set, we encrypt the journal file itself."""
+    from jrnl.config import update_config
+    from jrnl.config import validate_journal_name
+    from jrnl.install import save_config
+    from jrnl.journals import open_journal
+    from jrnl.messages import Message
+    from jrnl.messages import MsgStyle
+    from jrnl.messages import MsgText
+    from jrnl.output import print_msg
+
+    validate_journal_name(args.journal_name, config)
+
+    journal = open_journal(args.journal_name, config)
+
+    logging.debug("Clearing encryption method...")
+    journal.config["encrypt"] = False
+    journal.encryption_method = None
+
+    journal.write(args.filename)
+    print_msg(
+        Message(
+            MsgText.JournalDecryptedTo,
+            MsgStyle.NORMAL,
+            {"path": args.filename or journal.config["journal"]},
+        )
+    )
+
+    # Update the config, if we decrypted in place
+    if not args.filename:
+        update_config(
+            original_config, {"encrypt": False}, args.journal_name, force_local=True
+        )
+        save_config(original_config)
+
+    return 0
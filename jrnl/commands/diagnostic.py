@@ -0,0 +1,17 @@
+# Copyright © 2012-2023 jrnl contributors
+# License: https://www.gnu.org/licenses/gpl-3.0.html
+
+import sys
+
+
+def preconfig_diagnostic(_) -> None:
+    import platform
+
+    from jrnl import __title__
+    from jrnl import __version__
+
+    print(
+        f"{__title__}: {__version__}\n"
+        f"Python: {sys.version}\n"
+        f"OS: {platform.system()} {platform.release()}"
+    )
@@ -0,0 +1,69 @@
+# Copyright © 2012-2023 jrnl contributors
+# License: https://www.gnu.org/licenses/gpl-3.0.html
+
+import argparse
+import logging
+
+
+def postconfig_encrypt(
+    args: argparse.Namespace, config: dict, original_config: dict
+) -> int:
+    """
+    Encrypt a journal in place, or optionally to a new file
+    """
+    from jrnl.config import update_config
+    from jrnl.config import validate_journal_name
+    from jrnl.exception import JrnlException
+    from jrnl.install import save_config
+    from jrnl.journals import open_journal
+    from jrnl.messages import Message
+    from jrnl.messages import MsgStyle
+    from jrnl.messages import MsgText
+    from jrnl.output import print_msg
+
+    validate_journal_name(args.journal_name, config)
+
+    # Open the journal
+    journal = open_journal(args.journal_name, config)
+
+    if hasattr(journal, "can_be_encrypted") and not journal.can_be_encrypted:
+        raise JrnlException(
+            Message(
+                MsgText.CannotEncryptJournalType,
+                MsgStyle.ERROR,
+                {
+                    "journal_name": args.journal_name,
+                    "journal_type": journal.__class__.__name__,
+                },
+            )
+        )
+
+    # If journal is encrypted, create new password
+    logging.debug("Clearing encryption method...")
+
+    if journal.config["encrypt"] is True:
+        logging.debug("Journal already encrypted. Re-encrypting...")
+        print(f"Journal {journal.name} is already encrypted. Create a new password.")
+        journal.encryption_method.clear()
+    else:
+        journal.config["encrypt"] = True
+        journal.encryption_method = None
+
+    journal.write(args.filename)
+
+    print_msg(
+        Message(
+            MsgText.JournalEncryptedTo,
+            MsgStyle.NORMAL,
+            {"path": args.filename or journal.config["journal"]},
+        )
+    )
+
+    # Update the config, if we encrypted in place
+    if not args.filename:
+        update_config(
+            original_config, {"encrypt": True}, args.journal_name, force_local=True
+        )
+        save_config(original_config)
+
+    return 0
@@ -0,0 +1,20 @@
+# Copyright © 2012-2023 jrnl contributors
+# License: https://www.gnu.org/licenses/gpl-3.0.html
+
+import argparse
+
+
+def postconfig_import(args: argparse.Namespace, config: dict, **_) -> int:
+    from jrnl.config import validate_journal_name
+    from jrnl.journals import open_journal
+    from jrnl.plugins import get_importer
+
+    validate_journal_name(args.journal_name, config)
+
+    # Requires opening the journal
+    journal = open_journal(args.journal_name, config)
+
+    format = args.export if args.export else "jrnl"
+    get_importer(format).import_(journal, args.filename)
+
+    return 0
@@ -0,0 +1,66 @@
+# Copyright © 2012-2023 jrnl contributors
+# License: https://www.gnu.org/licenses/gpl-3.0.html
+
+import argparse
+
+
+def postconfig_index(args: argparse.Namespace, config: dict, **kwargs) -> int:
+    """
+    Standalone command to build/update the Day One index
+    """
+    from pathlib import Path
+
+    from jrnl.config import validate_journal_name
+    from jrnl.exception import JrnlException
+    from jrnl.messages import Message
+    from jrnl.messages import MsgStyle
+    from jrnl.output import print_msg
+    from jrnl.plugins.dayone_index import DayOneIndex
+    from jrnl.plugins.dayone_index import DayOneIndexMsg
+    from jrnl.plugins.dayone_index import IndexMode
+    from jrnl.plugins.dayone_index import iter_export_entries
+
+    validate_journal_name(args.journal_name, config)
+
+    # Initialize the index
+    index = DayOneIndex(mode=IndexMode.BUILD)
+
+    # Check if --clear flag is set
+    if args.clear:
+        index.clear()
+        print_msg(Message(DayOneIndexMsg.IndexCleared, MsgStyle.NORMAL))
+        return 0
+
+    if not args.filename:
+        raise JrnlException(
+            Message(
+                DayOneIndexMsg.IndexFileMissing,
+                MsgStyle.ERROR,
+            )
+        )
+
+    # Load and process Day One JSON file
+    input_path = Path(args.filename)
+    if not input_path.exists():
+        raise JrnlException(
+            Message(
+                DayOneIndexMsg.IndexFileNotFound,
+                MsgStyle.ERROR,
+                {"path": input_path},
+            )
+        )
+
+    # Update the index, streaming entries from the export. Entries that are already
+    # indexed are skipped before any of their fields are parsed.
+    old_count = len(index)
+    index.add_entries(iter_export_entries(input_path), args.journal_name, input_path)
+
+    if len(index) == old_count:
+        msg = DayOneIndexMsg.IndexUpToDate
+    elif old_count == 0:
+        msg = DayOneIndexMsg.IndexCreated
+    else:
+        msg = DayOneIndexMsg.IndexUpdated
+    print_msg(Message(msg, MsgStyle.NORMAL, {"count": len(index.entries)}))
+
+    return 0
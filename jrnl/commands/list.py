@@ -0,0 +1,12 @@
+# Copyright © 2012-2023 jrnl contributors
+# License: https://www.gnu.org/licenses/gpl-3.0.html
+
+import argparse
+
+
+def postconfig_list(args: argparse.Namespace, config: dict, **_) -> int:
+    from jrnl.output import list_journals
+
+    print(list_journals(config, args.export))
+
+    return 0
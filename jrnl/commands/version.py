@@ -0,0 +1,16 @@
+# Copyright © 2012-2023 jrnl contributors
+# License: https://www.gnu.org/licenses/gpl-3.0.html
+
+
+def preconfig_version(_) -> None:
+    from jrnl import __title__
+    from jrnl import __version__
+
+    print(
+        f"{__title__} {__version__}\n"
+        "\n"
+        "Copyright © 2012-2023 jrnl contributors\n"
+        "\n"
+        "This is free software, and you are welcome to redistribute it under certain\n"
+        "conditions; for details, see: https://www.gnu.org/licenses/gpl-3.0.html"
+    )
@@ -5,7 +5,6 @@ import argparse
 import logging
 import os
 from typing import Any
-from typing import Callable
 
 import colorama
 from rich.pretty import pretty_repr
@@ -207,14 +206,6 @@ def get_journal_name(args: argparse.Namespace, config: dict) -> argparse.Namespa
     return args
 
 
-def cmd_requires_valid_journal_name(func: Callable) -> Callable:
-    def wrapper(args: argparse.Namespace, config: dict, original_config: dict):
-        validate_journal_name(args.journal_name, config)
-        func(args=args, config=config, original_config=original_config)
-
-    return wrapper
-
-
 def validate_journal_name(journal_name: str, config: dict) -> None:
     if journal_name not in config["journals"]:
         raise JrnlException(
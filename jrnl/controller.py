@@ -5,6 +5,7 @@ import logging
 import sys
 from typing import TYPE_CHECKING
 
+from jrnl import commands
 from jrnl import install
 from jrnl import plugins
 from jrnl import time
@@ -26,6 +27,7 @@ from jrnl.override import apply_overrides
 
 if TYPE_CHECKING:
     from argparse import Namespace
+    from collections.abc import Callable
 
     from jrnl.journals import Entry
     from jrnl.journals import Journal
@@ -44,8 +46,8 @@ def run(args: "Namespace"):
     """
 
     # Run command if possible before config is available
-    if callable(args.preconfig_cmd):
-        return args.preconfig_cmd(args)
+    if args.preconfig_cmd:
+        return _get_command(args.preconfig_cmd)(args)
 
     # Load the config, and extract journal name
     config = install.load_or_install_jrnl(args.config_file_path)
@@ -58,8 +60,8 @@ def run(args: "Namespace"):
     config = scope_config(config, args.journal_name)
 
     # Run post-config command now that config is ready
-    if callable(args.postconfig_cmd):
-        return args.postconfig_cmd(
+    if args.postconfig_cmd:
+        return _get_command(args.postconfig_cmd)(
             args=args, config=config, original_config=original_config
         )
 
@@ -94,6 +96,14 @@ def run(args: "Namespace"):
         _display_search_results(**kwargs)
 
 
+def _get_command(command: "str | Callable") -> "Callable":
+    """Returns a standalone command as stored by `parse_args`: either the name of a
+    function in `jrnl.commands`, only imported now, or a callable"""
+    if isinstance(command, str):
+        return getattr(commands, command)
+    return command
+
+
 def _perform_actions_on_search_results(**kwargs):
     args = kwargs["args"]
 
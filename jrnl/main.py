@@ -5,15 +5,13 @@ import logging
 import sys
 import traceback
 
-from rich.logging import RichHandler
-
-from jrnl import controller
-from jrnl.args import parse_args
-from jrnl.exception import JrnlException
-from jrnl.messages import Message
-from jrnl.messages import MsgStyle
-from jrnl.messages import MsgText
-from jrnl.output import print_msg
+# Standalone commands that are run before any argument parsing, config or plugin
+# loading takes place, when they are the only argument given
+FAST_PATH_CMDS = {
+    "--version": "preconfig_version",
+    "-v": "preconfig_version",
+    "--diagnostic": "preconfig_diagnostic",
+}
 
 
 def configure_logger(debug: bool = False) -> None:
@@ -21,6 +19,8 @@ def configure_logger(debug: bool = False) -> None:
         logging.disable()
         return
 
+    from rich.logging import RichHandler
+
     logging.basicConfig(
         level=logging.DEBUG,
         datefmt="[%X]",
@@ -33,10 +33,23 @@ def configure_logger(debug: bool = False) -> None:
 
 
 def run(manual_args: list[str] | None = None) -> int:
-    try:
-        if manual_args is None:
-            manual_args = sys.argv[1:]
+    if manual_args is None:
+        manual_args = sys.argv[1:]
+
+    if len(manual_args) == 1 and manual_args[0] in FAST_PATH_CMDS:
+        from jrnl import commands
 
+        return getattr(commands, FAST_PATH_CMDS[manual_args[0]])(None)
+
+    from jrnl import controller
+    from jrnl.args import parse_args
+    from jrnl.exception import JrnlException
+    from jrnl.messages import Message
+    from jrnl.messages import MsgStyle
+    from jrnl.messages import MsgText
+    from jrnl.output import print_msg
+
+    try:
         args = parse_args(manual_args)
         configure_logger(args.debug)
         logging.debug("Parsed args:\n%s", args)
@@ -1,52 +1,53 @@
 # Copyright © 2012-2023 jrnl contributors
 # License: https://www.gnu.org/licenses/gpl-3.0.html
 
+import importlib
+from typing import TYPE_CHECKING
 from typing import Type
 
-from jrnl.plugins.calendar_heatmap_exporter import CalendarHeatmapExporter
-from jrnl.plugins.dates_exporter import DatesExporter
-from jrnl.plugins.dayone_json_importer import DayOneJSONImporter
-from jrnl.plugins.fancy_exporter import FancyExporter
-from jrnl.plugins.jrnl_importer import JRNLImporter
-from jrnl.plugins.json_exporter import JSONExporter
-from jrnl.plugins.markdown_exporter import MarkdownExporter
-from jrnl.plugins.tag_exporter import TagExporter
-from jrnl.plugins.text_exporter import TextExporter
-from jrnl.plugins.xml_exporter import XMLExporter
-from jrnl.plugins.yaml_exporter import YAMLExporter
-
-__exporters = [
-    CalendarHeatmapExporter,
-    DatesExporter,
-    FancyExporter,
-    JSONExporter,
-    MarkdownExporter,
-    TagExporter,
-    TextExporter,
-    XMLExporter,
-    YAMLExporter,
-]
-__importers = [JRNLImporter, DayOneJSONImporter]
-
-__exporter_types = {name: plugin for plugin in __exporters for name in plugin.names}
-__exporter_types["pretty"] = None
-__exporter_types["short"] = None
-__exporter_types["dayone"] = None
-__importer_types = {name: plugin for plugin in __importers for name in plugin.names}
+if TYPE_CHECKING:
+    from jrnl.plugins.jrnl_importer import JRNLImporter
+    from jrnl.plugins.text_exporter import TextExporter
+
+# Plugins are only imported once they are requested, so that commands that don't
+# import or export anything don't pay for them. Keys must match each plugin's `names`.
+__exporter_types = {
+    "calendar": ("jrnl.plugins.calendar_heatmap_exporter", "CalendarHeatmapExporter"),
+    "heatmap": ("jrnl.plugins.calendar_heatmap_exporter", "CalendarHeatmapExporter"),
+    "dates": ("jrnl.plugins.dates_exporter", "DatesExporter"),
+    "fancy": ("jrnl.plugins.fancy_exporter", "FancyExporter"),
+    "boxed": ("jrnl.plugins.fancy_exporter", "FancyExporter"),
+    "json": ("jrnl.plugins.json_exporter", "JSONExporter"),
+    "md": ("jrnl.plugins.markdown_exporter", "MarkdownExporter"),
+    "markdown": ("jrnl.plugins.markdown_exporter", "MarkdownExporter"),
+    "tags": ("jrnl.plugins.tag_exporter", "TagExporter"),
+    "text": ("jrnl.plugins.text_exporter", "TextExporter"),
+    "txt": ("jrnl.plugins.text_exporter", "TextExporter"),
+    "xml": ("jrnl.plugins.xml_exporter", "XMLExporter"),
+    "yaml": ("jrnl.plugins.yaml_exporter", "YAMLExporter"),
+    "pretty": None,
+    "short": None,
+    "dayone": None,
+}
+__importer_types = {
+    "jrnl": ("jrnl.plugins.jrnl_importer", "JRNLImporter"),
+    "dayone": ("jrnl.plugins.dayone_json_importer", "DayOneJSONImporter"),
+}
 
 EXPORT_FORMATS = sorted(__exporter_types.keys())
 IMPORT_FORMATS = sorted(__importer_types.keys())
 
 
-def get_exporter(format: str) -> Type[TextExporter] | None:
-    for exporter in __exporters:
-        if hasattr(exporter, "names") and format in exporter.names:
-            return exporter
-    return None
+def _load_plugin(location: tuple[str, str] | None) -> type | None:
+    if location is None:
+        return None
+    module_name, class_name = location
+    return getattr(importlib.import_module(module_name), class_name)
 
 
-def get_importer(format: str) -> Type[JRNLImporter] | None:
-    for importer in __importers:
-        if hasattr(importer, "names") and format in importer.names:
-            return importer
-    return None
+def get_exporter(format: str) -> Type["TextExporter"] | None:
+    return _load_plugin(__exporter_types.get(format))
+
+
+def get_importer(format: str) -> Type["JRNLImporter"] | None:
+    return _load_plugin(__importer_types.get(format))
@@ -1,16 +1,33 @@
 import json
+import os
+import re
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import Optional
 
+from jrnl.exception import JrnlException
 from jrnl.messages import Message
 from jrnl.messages import MsgStyle
 from jrnl.messages import MsgTextBase
 from jrnl.output import print_msg
+from jrnl.plugins.util import dump_json
 from jrnl.plugins.util import localize
+from jrnl.plugins.util import parse_iso_datetime
+from jrnl.plugins.util import read_json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+# Day One entry UUIDs, as they can appear in dayone2:// links
+UUID_RE = re.compile(r"[a-zA-Z0-9-]+")
 
 
 class DayOneIndexMsg(MsgTextBase):
@@ -18,11 +35,13 @@ class DayOneIndexMsg(MsgTextBase):
 
     IndexFileMissing = "Creating a Day One index requires an input file"
     IndexFileNotFound = "Day One index file {path} does not exist"
+    InvalidExport = "Invalid Day One export: {reason}"
     IndexNotFound = (
         "No Day One index found. Run 'jrnl --index' first to enable link resolution"
     )
     IndexCreated = "Day One index created from {count} entries"
     IndexUpdated = "Day One index updated ({count} entries)"
+    IndexUpToDate = "Day One index already up to date ({count} entries)"
     IndexCleared = "Day One index cleared"
     IndexNotUsable = (
         "Cannot resolve Day One links: index not found or empty. "
@@ -30,6 +49,72 @@ class DayOneIndexMsg(MsgTextBase):
     )
 
 
+def _escape_surrogates(text: str) -> str:
+    """Returns `text` with the lone surrogates it holds escaped
+
+    Lone surrogates can't be encoded as UTF-8. Paths hold them for undecodable bytes:
+    b"\\xff" is decoded as "\\udcff", which is then escaped as the text "\\xff".
+    """
+    try:
+        raw = os.fsencode(text)
+    except UnicodeEncodeError:
+        raw = text.encode("utf-8", "surrogatepass")
+    return raw.decode("utf-8", "backslashreplace")
+
+
+def _invalid_export(reason: str) -> JrnlException:
+    return JrnlException(
+        Message(
+            DayOneIndexMsg.InvalidExport,
+            MsgStyle.ERROR,
+            {"reason": reason},
+        )
+    )
+
+
+def iter_export_entries(path: Path) -> Iterator[dict]:
+    """Yield the entries of a Day One JSON export one at a time
+
+    The export is streamed with ijson when it is installed, so that only one entry
+    is held in memory at a time. Otherwise the whole file is parsed with `read_json`.
+
+    Raises:
+        JrnlException: If the export is not valid JSON or has no entries list
+    """
+    no_entries = _invalid_export("no entries found")
+
+    if ijson is None:
+        try:
+            data = read_json(path)
+        except json.JSONDecodeError as e:
+            raise _invalid_export(str(e)) from e
+        if not isinstance(data, dict) or "entries" not in data:
+            raise no_entries
+        yield from data["entries"]
+        return
+
+    with open(path, "rb") as f:
+        try:
+            has_entries = False
+            for entry in ijson.items(f, "entries.item", use_float=True):
+                has_entries = True
+                yield entry
+
+            if has_entries:
+                return
+
+            # Nothing was streamed, which is fine for an empty entries list. Scan the
+            # top-level keys to tell that apart from an export with no entries at all.
+            f.seek(0)
+            for prefix, event, value in ijson.parse(f):
+                if not prefix and event == "map_key" and value == "entries":
+                    return
+        except ijson.JSONError as e:
+            raise _invalid_export(str(e)) from e
+
+    raise no_entries
+
+
 class IndexMode(Enum):
     """Mode for Day One index creation"""
 
@@ -37,7 +122,7 @@ class IndexMode(Enum):
     BUILD = 1
 
 
-@dataclass(eq=False, frozen=True)
+@dataclass(eq=False, frozen=True, slots=True)
 class IndexedEntry:
     """Information about a Day One entry needed for link resolution"""
 
@@ -55,22 +140,39 @@ class IndexedEntry:
         return hash(self.uuid)
 
 
+# What the index stores for each entry UUID: (date, journal_name, export_source).
+# Plain tuples are much cheaper to build and hold than `IndexedEntry` objects, which
+# are only created for the entries that are actually looked up.
+IndexRecord = tuple[datetime, str, str]
+
+
 class DayOneIndex:
     """Maintains a persistent index of Day One entry UUIDs across multiple exports"""
 
+    # Indexes already parsed in this process, by index file, along with the
+    # (mtime, size) of the file when it was parsed. Every instance loading the same
+    # file shares its entries dict, which is only copied once an instance modifies it.
+    _cache: Dict[Path, tuple[tuple[int, int], Dict[str, IndexRecord]]] = {}
+
     def __init__(self, mode: IndexMode = IndexMode.USE):
         from jrnl.path import get_config_path
 
         config_dir = Path(get_config_path()).parent
         self.index_file = config_dir / "dayone_index.json"
-        self.entries: Dict[str, IndexedEntry] = {}
+        self.entries: Dict[str, IndexRecord] = {}
+        # Whether `entries` belongs to this instance alone, or is shared via the cache
+        self._owns_entries = True
         self.mode = mode
         self._load_index()
 
     @property
     def is_usable(self) -> bool:
-        """Check if the index is usable"""
-        return self.index_file.exists() and len(self.entries) > 0
+        """Check if the index is usable
+
+        Entries are only ever loaded from, or saved to, the index file, so there is
+        no need to stat the file on every lookup.
+        """
+        return bool(self.entries)
 
     def _load_index(self) -> None:
         """Load existing index if it exists"""
@@ -80,81 +182,130 @@ class DayOneIndex:
             return
 
         try:
-            with open(self.index_file, "r") as f:
-                data = json.load(f)
+            stat = self.index_file.stat()
+            version = (stat.st_mtime_ns, stat.st_size)
+            cached = DayOneIndex._cache.get(self.index_file)
+            if cached and cached[0] == version:
+                self.entries = cached[1]
+                self._owns_entries = False
+                return
+
+            data = read_json(self.index_file)
 
             self.entries = {
-                uuid: IndexedEntry(
-                    uuid=uuid,
-                    date=datetime.fromisoformat(entry["date"]),
-                    journal_name=entry["journal_name"],
-                    export_source=entry["export_source"],
+                uuid: (
+                    datetime.fromisoformat(entry["date"]),
+                    entry["journal_name"],
+                    entry["export_source"],
                 )
                 for uuid, entry in data.items()
             }
+            DayOneIndex._cache[self.index_file] = (version, self.entries)
+            self._owns_entries = False
         except Exception:
             # TODO: add some warning message that something went wrong
             self.entries = {}
 
     def _save_index(self) -> None:
-        """Save index to disk"""
-        data = {
-            uuid: {
-                "date": entry.date.isoformat(),
-                "journal_name": entry.journal_name,
-                "export_source": entry.export_source,
-            }
-            for uuid, entry in self.entries.items()
-        }
+        """Save index to disk, atomically replacing any previous index
 
-        with open(self.index_file, "w") as f:
-            json.dump(data, f, indent=2)
+        Entries are serialized one at a time, one per line, so that the whole index
+        never has to be held in memory a second time. The file is only read by jrnl,
+        so entries are written compactly, without indentation or extra whitespace.
+        """
+        # Write to a temporary file first, so that an interrupted save can't leave a
+        # truncated index behind
+        tmp_file = self.index_file.with_suffix(".json.tmp")
+        # Indexes saved by older versions of jrnl can hold export sources with lone
+        # surrogates. There are only a few distinct sources, so escape each once.
+        sources: Dict[str, str] = {}
+        try:
+            with open(tmp_file, "wb") as f:
+                f.write(b"{")
+                separator = b"\n"
+                for uuid, (date, journal_name, export_source) in self.entries.items():
+                    source = sources.get(export_source)
+                    if source is None:
+                        source = sources[export_source] = _escape_surrogates(
+                            export_source
+                        )
+                    record = {
+                        "date": date.isoformat(),
+                        "journal_name": journal_name,
+                        "export_source": source,
+                    }
+                    f.write(separator + dump_json(uuid) + b":" + dump_json(record))
+                    separator = b",\n"
+                f.write(b"\n}\n")
+
+            os.replace(tmp_file, self.index_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
 
     def clear(self) -> None:
         """Clear the index"""
         self.entries = {}
+        self._owns_entries = True
         self._save_index()
 
     def add_entries(
-        self, entries: list[dict], journal_name: str, export_source: Path
-    ) -> None:
+        self, entries: Iterable[dict], journal_name: str, export_source: Path
+    ) -> int:
         """
         Add entries from a Day One export to the index
 
         Args:
-            entries: List of Day One entry dictionaries
+            entries: Iterable of Day One entry dictionaries, consumed only once
             journal_name: Unique name of the journal these entries belong to
             export_source: Path to the Day One JSON export file
+
+        Returns:
+            The number of entries read from `entries`
         """
-        new_entries = False
+        indexed = self.entries
+        old_len = len(indexed)
+        # The source is only informative, so escape any undecodable bytes in the path
+        # rather than failing to save the index
+        export_source = _escape_surrogates(os.fspath(export_source))
+
+        count = 0
         for entry in entries:
+            count += 1
             uuid = entry.get("uuid")
-            if not uuid or uuid in self.entries:
+            if (
+                not isinstance(uuid, str)
+                or uuid in indexed
+                or not UUID_RE.fullmatch(uuid)
+            ):
                 continue
 
-            date = datetime.fromisoformat(entry["creationDate"].replace("Z", "+00:00"))
-            if tz := entry.get("timeZone"):
-                tz = tz.replace("\\", "")
-                date = localize(date, tz)
-
-            self.entries[uuid] = IndexedEntry(
-                uuid=uuid,
-                date=date,
-                journal_name=journal_name,
-                export_source=str(export_source),
+            date = localize(
+                parse_iso_datetime(entry["creationDate"]), entry.get("timeZone")
             )
 
-            new_entries = True
+            if not self._owns_entries:
+                # Copy the shared entries before the first change. The index file is
+                # about to change, so the cached copy won't be used again.
+                DayOneIndex._cache.pop(self.index_file, None)
+                indexed = self.entries = dict(indexed)
+                self._owns_entries = True
 
-        if new_entries:
+            indexed[uuid] = (date, journal_name, export_source)
+
+        if len(indexed) > old_len:
             self._save_index()
 
+        return count
+
     def __getitem__(self, uuid: str) -> Optional[IndexedEntry]:
         """Look up an entry by UUID"""
         if not self.is_usable and self.mode == IndexMode.USE:
             print_msg(Message(DayOneIndexMsg.IndexNotUsable, MsgStyle.WARNING))
             return None
-        return self.entries.get(uuid)
+        if record := self.entries.get(uuid):
+            return IndexedEntry(uuid, *record)
+        return None
 
     def __len__(self) -> int:
         return len(self.entries)
@@ -2,9 +2,8 @@
 # License: https://www.gnu.org/licenses/gpl-3.0.html
 
 import json
+import os
 import re
-import textwrap
-from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
@@ -17,10 +16,33 @@ from jrnl.messages import MsgTextBase
 from jrnl.output import print_msg
 from jrnl.plugins.dayone_index import DayOneIndex
 from jrnl.plugins.util import localize
+from jrnl.plugins.util import parse_iso_datetime
+from jrnl.plugins.util import read_json
 
 if TYPE_CHECKING:
     from jrnl.journals import Journal
 
+# Markdown links to other Day One entries, e.g. [text](dayone2://view?Id=UUID)
+DAYONE_LINK_RE = re.compile(r"\[([^\]]+)\]\(dayone2://view\?Id=([a-zA-Z0-9-]+)\)")
+
+# Embedded Day One media, e.g. ![](dayone-moment://ID) for photos, and
+# ![](dayone-moment:/pdfAttachment/ID) or ![](dayone-moment:/audio/ID) for the others
+MOMENT_RE = re.compile(r"!\[\]\(dayone-moment:(//|/pdfAttachment/|/audio/)([^)]+)\)")
+
+# Spurious escape sequences in Day One entry text, and what they stand for
+ESCAPE_RE = re.compile(r"\\([!.n])")
+ESCAPES = {"!": "!", ".": ".", "n": "\n"}
+
+# Translation table dropping the spaces from Day One tags
+NO_SPACES = str.maketrans("", "", " ")
+
+# Number of entries converted between progress messages
+PROGRESS_INTERVAL = 100
+
+
+def _unescape(match: re.Match) -> str:
+    return ESCAPES[match.group(1)]
+
 
 class DayOneMsg(MsgTextBase):
     """Messages specific to Day One import functionality."""
@@ -33,6 +55,11 @@ class DayOneMsg(MsgTextBase):
     ProcessingEntry = "Processing Day One entry {current} of {total}"
 
 
+# Messages printed from within the import loop, looked up once
+MEDIA_NOT_FOUND = DayOneMsg.MediaNotFound
+PROCESSING_ENTRY = DayOneMsg.ProcessingEntry
+
+
 class DayOneJSONImporter:
     """Imports entries from Day One JSON export files.
 
@@ -48,60 +75,96 @@ class DayOneJSONImporter:
     names = ["dayone"]
 
     @staticmethod
-    def _convert(entry: dict[str, Any], base_path: Path) -> str:
+    def _convert(
+        entry: dict[str, Any],
+        media_bases: dict[str, str],
+        *,
+        _localize=localize,
+        _parse_iso_datetime=parse_iso_datetime,
+        _unescape_sub=ESCAPE_RE.sub,
+        _moment_sub=MOMENT_RE.sub,
+        _no_spaces=NO_SPACES,
+    ) -> list[str]:
         """Convert a Day One entry to jrnl format.
 
+        The underscored keyword arguments are not meant to be passed: they bind the
+        helpers used for every entry as locals, which are faster to look up.
+
         Args:
             entry: A Day One entry dict containing at least 'creationDate' and 'text'
-            base_path: Path to the Day One export directory for resolving media paths
+            media_bases: Path prefixes of the "photos", "pdfs" and "audios" directories
+                of the Day One export, each ending with a path separator
 
         Returns:
-            A string containing the entry formatted for jrnl
+            The lines of the entry formatted for jrnl, ending with the entry text (if
+            any)
         """
         # Convert creation date to local time (Day One uses UTC)
-        date = datetime.fromisoformat(entry["creationDate"].replace("Z", "+00:00"))
-        if tz := entry.get("timeZone"):
-            tz = tz.replace("\\", "")
-            date = localize(date, tz)
-        date_str = f"[{date.strftime('%Y-%m-%d %H:%M:%S %p')}]"
+        get = entry.get
+        date = _localize(_parse_iso_datetime(entry["creationDate"]), get("timeZone"))
+        # Formatted by hand as jrnl's default "%F %r" time format, which is much faster
+        # than strftime
+        hour = date.hour % 12 or 12
+        meridiem = "AM" if date.hour < 12 else "PM"
+        date_str = (
+            f"[{date.year:04d}-{date.month:02d}-{date.day:02d} "
+            f"{hour:02d}:{date.minute:02d}:{date.second:02d} {meridiem}]"
+        )
 
         # Cleanup entry text from spurious escape sequences
-        if text := entry.get("text"):
-            text = text.replace("\\!", "!").replace("\\.", ".").replace("\\n", "\n")
-
-        # Fetch tags (if any) and add them as the first line
-        if tags := entry.get("tags"):
-            tags = [(t[0].lower() + t[1:]).replace(" ", "") for t in tags]
+        if text := get("text"):
+            text = _unescape_sub(_unescape, text)
+
+        # Fetch tags (if any) and add them as the first line, skipping empty ones
+        tags = [
+            tag
+            for t in get("tags") or ()
+            if (tag := (t[:1].lower() + t[1:]).translate(_no_spaces))
+        ]
+        if tags:
             tags_str = " ".join(f"#{tag}" for tag in tags)
         else:
             tags_str = "#untagged"
 
         # Add star marker if entry is starred/favorite
-        tags_str += " *\n" if entry.get("starred", False) else "\n"
+        tags_str += " *\n" if get("starred", False) else "\n"
+
+        # Handle media references, keyed by the prefix of their moment URL and id. Most
+        # entries don't embed any, so look for one before collecting media paths.
+        if text and "dayone-moment:" in text:
+            media_paths = {}
 
-        # Handle media references
-        if text:
             if "photos" in entry:
+                photos_base = media_bases["photos"]
                 for photo in entry["photos"]:
-                    moment_url = f"dayone-moment://{photo['identifier']}"
-                    local_path = (
-                        base_path / "photos" / f"{photo['md5']}.{photo['type']}"
+                    media_paths.setdefault(
+                        ("//", photo["identifier"]),
+                        f"{photos_base}{photo['md5']}.{photo['type']}",
                     )
-                    text = text.replace(f"![]({moment_url})", f"![]({local_path})")
 
             if "pdfAttachments" in entry:
+                pdfs_base = media_bases["pdfs"]
                 for pdf in entry["pdfAttachments"]:
-                    moment_url = f"dayone-moment:/pdfAttachment/{pdf['identifier']}"
-                    local_path = base_path / "pdfs" / f"{pdf['md5']}.pdf"
-                    text = text.replace(f"![]({moment_url})", f"![]({local_path})")
+                    media_paths.setdefault(
+                        ("/pdfAttachment/", pdf["identifier"]),
+                        f"{pdfs_base}{pdf['md5']}.pdf",
+                    )
 
             if "audios" in entry:
+                audios_base = media_bases["audios"]
                 for audio in entry["audios"]:
-                    moment_url = f"dayone-moment:/audio/{audio['identifier']}"
-                    local_path = (
-                        base_path / "audios" / f"{audio['md5']}.{audio['format']}"
+                    media_paths.setdefault(
+                        ("/audio/", audio["identifier"]),
+                        f"{audios_base}{audio['md5']}.{audio['format']}",
                     )
-                    text = text.replace(f"![]({moment_url})", f"![]({local_path})")
+
+            if media_paths:
+
+                def replace_moment(match: re.Match) -> str:
+                    local_path = media_paths.get(match.groups())
+                    return f"![]({local_path})" if local_path else match.group(0)
+
+                text = _moment_sub(replace_moment, text)
 
         # Add metadata lines (indented with 4 spaces)
         metadata_lines = []
@@ -137,13 +200,12 @@ class DayOneJSONImporter:
         lines = [f"{date_str} {tags_str}"]
 
         if metadata_lines:
-            metatada_str = textwrap.indent("\n".join(metadata_lines), prefix="    ")
-            lines.append(metatada_str)
+            lines.extend(f"    {line}" for line in metadata_lines)
 
         if text:
             lines.extend(["", text.strip()])
 
-        return "\n".join(lines)
+        return lines
 
     @staticmethod
     def import_(journal: "Journal", input: str | None = None) -> None:
@@ -169,8 +231,7 @@ class DayOneJSONImporter:
             )
 
         try:
-            with open(input_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_json(input_path)
         except json.JSONDecodeError as e:
             raise JrnlException(
                 Message(DayOneMsg.InvalidJSON, MsgStyle.ERROR, {"error": str(e)})
@@ -185,23 +246,68 @@ class DayOneJSONImporter:
                 )
             )
 
-        # Index entries
+        old_cnt = len(journal.entries)
+        total_entries = len(data["entries"])
+
+        # Setup index for resolving links
         index = DayOneIndex()
 
-        # Verify media files exist
+        def replace_link(match: re.Match) -> str:
+            """Replace a Day One link with a link to the indexed entry, if any."""
+            link_text, entry_uuid = match.groups()
+
+            target = index[entry_uuid]
+            if not target:
+                return match.group(0)
+
+            return f"[[{target.journal_name}/{target.date:%Y/%m/%d}|{link_text}]]"
+
+        # List each media directory only once, instead of checking every file on its own
         media_types = {"photos": "photos", "pdfAttachments": "pdfs", "audios": "audios"}
+        media_files = {}
+        for media_dir in media_types.values():
+            try:
+                media_files[media_dir] = set(os.listdir(input_path.parent / media_dir))
+            except OSError:
+                media_files[media_dir] = set()
+
+        # Media paths only end up in the entry text, so build them as plain strings
+        media_bases = {
+            media_dir: f"{input_path.parent / media_dir}{os.sep}"
+            for media_dir in media_types.values()
+        }
+
+        # Process entries with status updates, verifying their media files exist
         media_count = 0
-        for entry in data.get("entries", []):
+        lines = []
+        for i, entry in enumerate(data["entries"], 1):
+            # Report progress every so often, rather than writing a line per entry
+            if i % PROGRESS_INTERVAL == 0 or i == total_entries:
+                print_msg(
+                    Message(
+                        PROCESSING_ENTRY,
+                        MsgStyle.NORMAL,
+                        {"current": i, "total": total_entries},
+                    )
+                )
+
             for media_type, media_dir in media_types.items():
                 for media in entry.get(media_type, []):
                     ext = media.get("type", "") or media.get("format", "")
                     # Inconsistent media type and ext if media is an audio file
                     ext = "m4a" if ext == "aac" else ext
-                    media_path = input_path.parent / media_dir / f"{media['md5']}.{ext}"
+                    media_name = f"{media['md5']}.{ext}"
+                    if media_name in media_files[media_dir]:
+                        media_count += 1
+                        continue
+
+                    # Fall back to the file system on a miss, e.g. for names that only
+                    # match on case-insensitive file systems
+                    media_path = input_path.parent / media_dir / media_name
                     if not media_path.exists():
                         print_msg(
                             Message(
-                                DayOneMsg.MediaNotFound,
+                                MEDIA_NOT_FOUND,
                                 MsgStyle.WARNING,
                                 {"path": str(media_path)},
                             )
@@ -209,6 +315,15 @@ class DayOneJSONImporter:
                     else:
                         media_count += 1
 
+            # Convert entry and resolve any links in its text
+            entry_lines = DayOneJSONImporter._convert(entry, media_bases)
+            entry_lines[-1] = DAYONE_LINK_RE.sub(replace_link, entry_lines[-1])
+
+            # Add entry to journal, separated from the previous one by a blank line
+            if lines:
+                lines.append("")
+            lines.extend(entry_lines)
+
         if media_count > 0:
             print_msg(
                 Message(
@@ -218,49 +333,8 @@ class DayOneJSONImporter:
                 )
             )
 
-        old_cnt = len(journal.entries)
-        total_entries = len(data["entries"])
-
-        # Setup index for resolving links
-        index = DayOneIndex()
-
-        def resolve_links(text: str) -> str:
-            """Resolve Day One links in the text."""
-            link_re = re.compile(r"\[([^\]]+)\]\(dayone2://view\?Id=([a-zA-Z0-9-]+)\)")
-
-            def replace_link(match: re.Match) -> str:
-                link_text, entry_uuid = match.groups()
-
-                target = index[entry_uuid]
-                if not target:
-                    return match.group(0)
-
-                return f"[[{target.journal_name}/{target.date:%Y/%m/%d}|{link_text}]]"
-
-            return link_re.sub(replace_link, text)
-
-        # Process entries with status updates
-        entries_text = []
-        for i, entry in enumerate(data["entries"], 1):
-            print_msg(
-                Message(
-                    DayOneMsg.ProcessingEntry,
-                    MsgStyle.NORMAL,
-                    {"current": i, "total": total_entries},
-                )
-            )
-
-            # Convert entry
-            entry_text = DayOneJSONImporter._convert(entry, input_path.parent)
-            # Resolve any links in the entry
-            if entry_text:
-                entry_text = resolve_links(entry_text)
-
-            # Add entry to journal
-            entries_text.append(entry_text)
-
         # Import all entries
-        journal.import_("\n\n".join(entries_text))
+        journal.import_("\n".join(lines))
         journal.write()
 
         # Return import summary
@@ -1,15 +1,23 @@
 # Copyright © 2012-2023 jrnl contributors
 # License: https://www.gnu.org/licenses/gpl-3.0.html
 
+import re
+import sys
 from collections import Counter
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import TYPE_CHECKING
+from typing import Any
 from typing import Optional
 from zoneinfo import ZoneInfo
 
 if TYPE_CHECKING:
     from jrnl.journals import Journal
 
+# A JSON escape of a UTF-16 surrogate, e.g. \udcff
+SURROGATE_ESCAPE_RE = re.compile(rb"\\u[dD][89a-fA-F]")
+
 
 class NestedDict(dict):
     """https://stackoverflow.com/a/74873621/8740440"""
@@ -66,6 +74,26 @@ def get_journal_frequency_one_level(journal: "Journal") -> Counter:
     return date_counts
 
 
+if sys.version_info >= (3, 11):
+    # Python 3.11+ natively parses the "Z" (UTC) suffix used by e.g. Day One
+    parse_iso_datetime = datetime.fromisoformat
+else:
+
+    def parse_iso_datetime(date_str: str) -> datetime:
+        """Returns a `datetime` object from an ISO 8601 string, allowing a "Z" suffix"""
+        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+
+
+@lru_cache(maxsize=64)
+def get_zoneinfo(tz: str) -> ZoneInfo:
+    """Returns the `ZoneInfo` for the time-zone string `tz`, cached per string
+
+    Backslashes are dropped, as Day One exports escape the slash in time-zone names
+    (e.g. "Europe\\/Zurich"). Doing so here means it only happens once per string.
+    """
+    return ZoneInfo(tz.replace("\\", ""))
+
+
 def localize(date: datetime, tz: Optional[str]) -> datetime:
     """Returns a localized `datetime` object
 
@@ -78,4 +106,47 @@ def localize(date: datetime, tz: Optional[str]) -> datetime:
     """
     if not tz:
         return date
-    return date.astimezone(ZoneInfo(tz))
+    return date.astimezone(get_zoneinfo(tz))
+
+
+@lru_cache(maxsize=None)
+def _orjson() -> Any:
+    """Returns the orjson module, or None if it isn't installed
+
+    orjson is only imported once JSON is actually read or written, as most commands
+    importing this module never do either.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def read_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed
+
+    Both parsers raise a subclass of `json.JSONDecodeError` on invalid input.
+    """
+    import json
+
+    raw = path.read_bytes()
+    if orjson := _orjson():
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects the escaped lone surrogates that json.dump writes for
+            # undecodable file names. Only those are worth parsing a second time.
+            if not SURROGATE_ESCAPE_RE.search(raw):
+                raise
+    return json.loads(raw)
+
+
+def dump_json(obj: Any) -> bytes:
+    """Serialize `obj` to UTF-8 encoded JSON, using orjson when it is installed"""
+    if orjson := _orjson():
+        return orjson.dumps(obj)
+
+    import json
+
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,226 @@
+# Copyright © 2012-2023 jrnl contributors
+# License: https://www.gnu.org/licenses/gpl-3.0.html
+
+import json
+from argparse import Namespace
+from unittest import mock
+
+import pytest
+
+from jrnl.commands.index import postconfig_index
+from jrnl.exception import JrnlException
+from jrnl.plugins.dayone_index import DayOneIndex
+from jrnl.plugins.dayone_index import DayOneIndexMsg
+from jrnl.plugins.dayone_index import IndexMode
+from jrnl.plugins.dayone_index import iter_export_entries
+from jrnl.plugins.util import read_json
+
+
+@pytest.fixture(params=["ijson", "read_json"])
+def parser(request):
+    if request.param == "ijson":
+        yield request.param
+    else:
+        with mock.patch("jrnl.plugins.dayone_index.ijson", None):
+            yield request.param
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request):
+    if request.param == "orjson":
+        yield request.param
+    else:
+        with mock.patch("jrnl.plugins.util._orjson", return_value=None):
+            yield request.param
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    with mock.patch(
+        "jrnl.path.get_config_path", return_value=str(tmp_path / "jrnl.yaml")
+    ), mock.patch.dict(DayOneIndex._cache, clear=True):
+        yield tmp_path
+
+
+def entry(uuid, date="2023-01-02T03:04:05Z"):
+    return {"uuid": uuid, "creationDate": date}
+
+
+def write_export(tmp_path, content):
+    export = tmp_path / "export.json"
+    if not isinstance(content, str):
+        content = json.dumps(content)
+    export.write_text(content)
+    return export
+
+
+def test_iter_export_entries(parser, tmp_path):
+    entries = [{"uuid": "A", "n": 1.5}, {"uuid": "B", "tags": ["x"]}]
+    export = write_export(tmp_path, {"metadata": {}, "entries": entries})
+
+    assert list(iter_export_entries(export)) == entries
+
+
+def test_iter_export_entries_empty_list(parser, tmp_path):
+    export = write_export(tmp_path, {"entries": []})
+
+    assert list(iter_export_entries(export)) == []
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        {"metadata": {"entries": [{"uuid": "A"}]}},
+        [{"uuid": "A"}],
+        ["entries"],
+    ],
+    ids=["nested entries", "top-level list", "top-level list of keys"],
+)
+def test_iter_export_entries_without_entries(parser, tmp_path, content):
+    export = write_export(tmp_path, content)
+
+    with pytest.raises(JrnlException) as ex:
+        list(iter_export_entries(export))
+
+    assert ex.value.has_message_text(DayOneIndexMsg.InvalidExport)
+
+
+def test_iter_export_entries_truncated(parser, tmp_path):
+    export = write_export(tmp_path, '{"entries": [{"uuid": "A"}, {"uuid": "B"')
+
+    with pytest.raises(JrnlException) as ex:
+        list(iter_export_entries(export))
+
+    assert ex.value.has_message_text(DayOneIndexMsg.InvalidExport)
+
+
+@pytest.mark.parametrize(
+    "failing", ["jrnl.plugins.dayone_index.dump_json", "os.replace"]
+)
+def test_failed_save_keeps_previous_index(config_dir, failing):
+    index = DayOneIndex(mode=IndexMode.BUILD)
+    index.add_entries([entry("A")], "default", config_dir / "export.json")
+    saved = index.index_file.read_bytes()
+
+    with mock.patch(failing, side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            index.add_entries([entry("B")], "default", config_dir / "export.json")
+
+    assert index.index_file.read_bytes() == saved
+    assert not index.index_file.with_suffix(".json.tmp").exists()
+
+
+def test_legacy_index_with_surrogates_can_be_updated(config_dir, json_backend):
+    # Older versions of jrnl saved the index with json.dump, which escapes the lone
+    # surrogates of undecodable file names
+    index_file = config_dir / "dayone_index.json"
+    legacy = {
+        "A": {
+            "date": "2023-01-02T03:04:05+00:00",
+            "journal_name": "default",
+            "export_source": "/exports/\udcff.json",
+        }
+    }
+    index_file.write_text(json.dumps(legacy))
+
+    index = DayOneIndex(mode=IndexMode.BUILD)
+    assert len(index) == 1
+
+    index.add_entries([entry("B")], "default", config_dir / "export.json")
+
+    DayOneIndex._cache.clear()
+    index = DayOneIndex()
+    assert index["A"].export_source == "/exports/\\xff.json"
+    assert index["B"].export_source == str(config_dir / "export.json")
+
+
+def test_invalid_json_is_only_parsed_once(tmp_path):
+    pytest.importorskip("orjson")
+    export = write_export(tmp_path, '{"entries": [{"uuid": "A"}')
+
+    with mock.patch("json.loads") as loads, pytest.raises(json.JSONDecodeError):
+        read_json(export)
+
+    loads.assert_not_called()
+
+
+def test_instances_share_unchanged_index(config_dir):
+    DayOneIndex(mode=IndexMode.BUILD).add_entries(
+        [entry("A")], "default", config_dir / "export.json"
+    )
+
+    first, second = DayOneIndex(), DayOneIndex()
+
+    assert first.entries is second.entries
+    assert list(first.entries) == ["A"]
+
+
+def test_adding_entries_leaves_other_instances_unchanged(config_dir):
+    DayOneIndex(mode=IndexMode.BUILD).add_entries(
+        [entry("A")], "default", config_dir / "export.json"
+    )
+    first, second = DayOneIndex(), DayOneIndex(mode=IndexMode.BUILD)
+
+    second.add_entries([entry("B")], "default", config_dir / "export.json")
+
+    assert list(first.entries) == ["A"]
+    assert list(second.entries) == ["A", "B"]
+    assert list(DayOneIndex().entries) == ["A", "B"]
+
+
+def test_index_is_reloaded_when_its_file_changes(config_dir):
+    index = DayOneIndex(mode=IndexMode.BUILD)
+    index.add_entries([entry("A")], "default", config_dir / "export.json")
+    assert list(DayOneIndex().entries) == ["A"]
+
+    record = {"date": "2023-01-02T03:04:05", "journal_name": "other"}
+    index.index_file.write_text(
+        json.dumps({"B": {**record, "export_source": "/exports/other.json"}})
+    )
+
+    reloaded = DayOneIndex()
+    assert list(reloaded.entries) == ["B"]
+    assert reloaded["B"].journal_name == "other"
+
+
+def test_cleared_index_is_not_reused(config_dir):
+    index = DayOneIndex(mode=IndexMode.BUILD)
+    index.add_entries([entry("A")], "default", config_dir / "export.json")
+    other = DayOneIndex()
+
+    index.clear()
+
+    assert list(other.entries) == ["A"]
+    assert len(DayOneIndex(mode=IndexMode.BUILD)) == 0
+
+
+def test_entries_with_invalid_uuids_are_skipped(config_dir):
+    invalid = [{}, {"uuid": None}, {"uuid": 123}, {"uuid": ["A"]}]
+    invalid += [{"uuid": uuid} for uuid in ["", "not a uuid", "A/B", "A\n"]]
+    index = DayOneIndex(mode=IndexMode.BUILD)
+
+    count = index.add_entries(
+        [*invalid, entry("AB-12"), entry("AB-12")], "default", config_dir / "e.json"
+    )
+
+    assert count == len(invalid) + 2
+    assert list(index.entries) == ["AB-12"]
+
+
+def index_export(config_dir, *uuids):
+    export = write_export(config_dir, {"entries": [entry(uuid) for uuid in uuids]})
+    args = Namespace(journal_name="default", clear=False, filename=str(export))
+
+    with mock.patch("jrnl.output.print_msg") as print_msg:
+        postconfig_index(args, {"journals": {"default": {}}})
+
+    (msg,), _ = print_msg.call_args
+    return msg.text, msg.params["count"]
+
+
+def test_index_command_reports_changes(config_dir):
+    assert index_export(config_dir, "A", "B", "B") == (DayOneIndexMsg.IndexCreated, 2)
+    assert index_export(config_dir, "A", "B") == (DayOneIndexMsg.IndexUpToDate, 2)
+    assert index_export(config_dir) == (DayOneIndexMsg.IndexUpToDate, 2)
+    assert index_export(config_dir, "A", "B", "C") == (DayOneIndexMsg.IndexUpdated, 3)
+    assert index_export(config_dir, "D") == (DayOneIndexMsg.IndexUpdated, 4)
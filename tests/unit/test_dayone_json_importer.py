@@ -0,0 +1,140 @@
+# Copyright © 2012-2023 jrnl contributors
+# License: https://www.gnu.org/licenses/gpl-3.0.html
+
+import json
+from datetime import datetime
+from unittest import mock
+
+import pytest
+
+from jrnl.journals import Journal
+from jrnl.plugins.dayone_index import DayOneIndex
+from jrnl.plugins.dayone_index import IndexMode
+from jrnl.plugins.dayone_json_importer import DayOneJSONImporter
+
+MEDIA_BASES = {
+    "photos": "/export/photos/",
+    "pdfs": "/export/pdfs/",
+    "audios": "/export/audios/",
+}
+
+
+def convert(**entry):
+    return DayOneJSONImporter._convert(
+        {"creationDate": "2023-01-02T03:04:05Z", **entry}, MEDIA_BASES
+    )
+
+
+@pytest.mark.parametrize(
+    "creation_date,expected",
+    [
+        ("2023-01-02T00:05:00Z", "[2023-01-02 12:05:00 AM]"),
+        ("2023-01-02T12:30:00Z", "[2023-01-02 12:30:00 PM]"),
+        ("2023-01-02T23:45:10Z", "[2023-01-02 11:45:10 PM]"),
+    ],
+)
+def test_convert_date_uses_12_hour_clock(creation_date, expected):
+    lines = convert(creationDate=creation_date)
+
+    assert lines[0] == f"{expected} #untagged\n"
+
+
+def test_convert_date_is_localized():
+    lines = convert(creationDate="2023-01-02T23:45:10Z", timeZone="Europe\\/Zurich")
+
+    assert lines[0].startswith("[2023-01-03 12:45:10 AM] ")
+
+
+def test_convert_unescapes_text():
+    lines = convert(text="Hello\\! One\\. Two\\nThree")
+
+    assert lines[-1] == "Hello! One. Two\nThree"
+
+
+@pytest.mark.parametrize(
+    "media_key,media,moment,expected_path",
+    [
+        (
+            "photos",
+            {"identifier": "P1", "md5": "abc", "type": "jpeg"},
+            "dayone-moment://P1",
+            "/export/photos/abc.jpeg",
+        ),
+        (
+            "pdfAttachments",
+            {"identifier": "D1", "md5": "def"},
+            "dayone-moment:/pdfAttachment/D1",
+            "/export/pdfs/def.pdf",
+        ),
+        (
+            "audios",
+            {"identifier": "A1", "md5": "ghi", "format": "m4a"},
+            "dayone-moment:/audio/A1",
+            "/export/audios/ghi.m4a",
+        ),
+    ],
+)
+def test_convert_replaces_known_media_references(
+    media_key, media, moment, expected_path
+):
+    unknown = moment[: -len(media["identifier"])] + "UNKNOWN"
+    lines = convert(
+        text=f"Known ![]({moment}) unknown ![]({unknown})", **{media_key: [media]}
+    )
+
+    assert lines[-1] == f"Known ![]({expected_path}) unknown ![]({unknown})"
+
+
+def test_convert_tags():
+    lines = convert(tags=["Foo Bar", "", " ", "baz"], starred=True)
+
+    assert lines[0].endswith(" #fooBar #baz *\n")
+
+
+def test_convert_only_empty_tags_is_untagged():
+    lines = convert(tags=[""])
+
+    assert lines[0].endswith(" #untagged\n")
+
+
+def test_import_round_trip(tmp_path):
+    export = tmp_path / "export" / "export.json"
+    (export.parent / "photos").mkdir(parents=True)
+    (export.parent / "photos" / "abc.jpeg").touch()
+    entries = [
+        {
+            "uuid": "AAAA",
+            "creationDate": "2023-01-02T15:30:00Z",
+            "text": "First entry\\. With a photo ![](dayone-moment://P1)",
+            "tags": ["Work"],
+            "starred": True,
+            "photos": [{"identifier": "P1", "md5": "abc", "type": "jpeg"}],
+        },
+        {
+            "uuid": "BBBB",
+            "creationDate": "2023-01-03T08:00:00Z",
+            "text": "Second entry\\nSee [the first](dayone2://view?Id=AAAA)",
+        },
+    ]
+    export.write_text(json.dumps({"entries": entries}))
+    journal_file = tmp_path / "journal.txt"
+    config = {"journal": str(journal_file), "timeformat": "%F %r", "tagsymbols": "#@"}
+
+    with mock.patch("jrnl.path.get_config_path", return_value=str(tmp_path / "c")):
+        index = DayOneIndex(mode=IndexMode.BUILD)
+        index.add_entries(entries, "default", export)
+
+        DayOneJSONImporter.import_(Journal("default", **config), str(export))
+
+    first, second = Journal("default", **config).open().entries
+
+    assert first.date == datetime(2023, 1, 2, 15, 30)
+    assert first.starred
+    assert first.tags == ["#work"]
+    assert first.body.strip() == (
+        f"First entry. With a photo ![]({export.parent / 'photos' / 'abc.jpeg'})"
+    )
+
+    assert second.date == datetime(2023, 1, 3, 8, 0)
+    assert second.tags == ["#untagged"]
+    assert second.body.strip() == "Second entry\nSee [[default/2023/01/02|the first]]"
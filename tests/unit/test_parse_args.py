@@ -74,10 +74,8 @@ def test_change_time_alone():
 
 
 def test_diagnostic_alone():
-    from jrnl.commands import preconfig_diagnostic
-
     assert cli_as_dict("--diagnostic") == expected_args(
-        preconfig_cmd=preconfig_diagnostic
+        preconfig_cmd="preconfig_diagnostic"
     )
 
 
@@ -86,15 +84,15 @@ def test_edit_alone():
 
 
 def test_encrypt_alone():
-    from jrnl.commands import postconfig_encrypt
-
-    assert cli_as_dict("--encrypt") == expected_args(postconfig_cmd=postconfig_encrypt)
+    assert cli_as_dict("--encrypt") == expected_args(
+        postconfig_cmd="postconfig_encrypt"
+    )
 
 
 def test_decrypt_alone():
-    from jrnl.commands import postconfig_decrypt
-
-    assert cli_as_dict("--decrypt") == expected_args(postconfig_cmd=postconfig_decrypt)
+    assert cli_as_dict("--decrypt") == expected_args(
+        postconfig_cmd="postconfig_decrypt"
+    )
 
 
 def test_end_date_alone():
@@ -143,9 +141,7 @@ def test_export_alone():
 
 
 def test_import_alone():
-    from jrnl.commands import postconfig_import
-
-    assert cli_as_dict("--import") == expected_args(postconfig_cmd=postconfig_import)
+    assert cli_as_dict("--import") == expected_args(postconfig_cmd="postconfig_import")
 
 
 def test_file_flag_alone():
@@ -166,9 +162,7 @@ def test_limit_shorthand_alone():
 
 
 def test_list_alone():
-    from jrnl.commands import postconfig_list
-
-    assert cli_as_dict("--ls") == expected_args(postconfig_cmd=postconfig_list)
+    assert cli_as_dict("--ls") == expected_args(postconfig_cmd="postconfig_list")
 
 
 def test_on_date_alone():
@@ -224,9 +218,7 @@ def test_text_alone():
 
 
 def test_version_alone():
-    from jrnl.commands import preconfig_version
-
-    assert cli_as_dict("--version") == expected_args(preconfig_cmd=preconfig_version)
+    assert cli_as_dict("--version") == expected_args(preconfig_cmd="preconfig_version")
 
 
 def test_editor_override():
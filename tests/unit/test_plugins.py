@@ -0,0 +1,29 @@
+# Copyright © 2012-2023 jrnl contributors
+# License: https://www.gnu.org/licenses/gpl-3.0.html
+
+import pytest
+
+from jrnl.plugins import EXPORT_FORMATS
+from jrnl.plugins import IMPORT_FORMATS
+from jrnl.plugins import get_exporter
+from jrnl.plugins import get_importer
+
+
+@pytest.mark.parametrize("export_format", EXPORT_FORMATS)
+def test_exporter_is_registered_under_its_names(export_format):
+    exporter = get_exporter(export_format)
+
+    if export_format in ["pretty", "short", "dayone"]:
+        assert exporter is None
+    else:
+        assert export_format in exporter.names
+
+
+@pytest.mark.parametrize("import_format", IMPORT_FORMATS)
+def test_importer_is_registered_under_its_names(import_format):
+    assert import_format in get_importer(import_format).names
+
+
+def test_unknown_format_has_no_plugin():
+    assert get_exporter("unknown") is None
+    assert get_importer("unknown") is None